@@ -11,17 +11,16 @@ const cors = require('cors');
 const app = express();
 const PORT = process.env.PORT || 3001;
 
+// Supported model types
+const VALID_MODEL_TYPES = new Set(['cognos', 'microstrategy', 'tableau']);
+
 // Middleware
-app.use(cors());
+app.use(cors({ methods: ['GET', 'POST'], allowedHeaders: ['Content-Type'] }));
 app.use(express.json());
 
-// Mock AI responses for demonstration
-const generateMockResponse = (modelType, messages) => {
-  const lastMessage = messages[messages.length - 1]?.content || '';
-  
-  // Simple response generation based on keywords
-  if (lastMessage.toLowerCase().includes('var')) {
-    return `Here's the DAX formula using VAR for better readability:
+// Canned responses, matched case-insensitively against the last message in order
+const MOCK_KEYWORD_RESPONSES = [
+  [/var/i, `Here's the DAX formula using VAR for better readability:
 
 \`\`\`dax
 VAR TotalRevenue = SUM([Revenue])
@@ -30,11 +29,8 @@ RETURN
     DIVIDE(TotalRevenue, TotalUnits)
 \`\`\`
 
-This approach stores intermediate calculations in variables, making the formula easier to read and maintain.`;
-  }
-  
-  if (lastMessage.toLowerCase().includes('optimize')) {
-    return `Here's an optimized version of the DAX formula:
+This approach stores intermediate calculations in variables, making the formula easier to read and maintain.`],
+  [/optimize/i, `Here's an optimized version of the DAX formula:
 
 \`\`\`dax
 CALCULATE(
@@ -43,10 +39,10 @@ CALCULATE(
 )
 \`\`\`
 
-This version uses CALCULATE with REMOVEFILTERS for better performance.`;
-  }
-  
-  return `I understand you want to refine the DAX formula. Here's an improved version:
+This version uses CALCULATE with REMOVEFILTERS for better performance.`]
+];
+
+const MOCK_DEFAULT_RESPONSE = `I understand you want to refine the DAX formula. Here's an improved version:
 
 \`\`\`dax
 SUMX(
@@ -56,6 +52,14 @@ SUMX(
 \`\`\`
 
 This uses SUMX for row-by-row calculation which can be more accurate.`;
+
+// Mock AI responses for demonstration
+const generateMockResponse = (modelType, messages) => {
+  const lastMessage = messages[messages.length - 1]?.content || '';
+  
+  // Simple response generation based on keywords
+  const matched = MOCK_KEYWORD_RESPONSES.find(([pattern]) => pattern.test(lastMessage));
+  return matched ? matched[1] : MOCK_DEFAULT_RESPONSE;
 };
 
 // Chat endpoint
@@ -71,10 +75,9 @@ app.post('/api/v1/chat', async (req, res) => {
     }
     
     // Validate model type
-    const validModelTypes = ['cognos', 'microstrategy', 'tableau'];
-    if (!validModelTypes.includes(model_type)) {
+    if (!VALID_MODEL_TYPES.has(model_type)) {
       return res.status(400).json({
-        error: `Invalid model_type. Must be one of: ${validModelTypes.join(', ')}`
+        error: `Invalid model_type. Must be one of: ${[...VALID_MODEL_TYPES].join(', ')}`
       });
     }
     
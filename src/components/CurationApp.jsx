@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useMemo } from 'react';
 import ExamplesList from './ExamplesList.jsx';
 import ChatInterface from './ChatInterface.jsx';
 import Toast from './Toast.jsx';
@@ -23,7 +23,13 @@ const CurationApp = ({ modelType }) => {
     tableau: 'Tableau to Power BI'
   };
 
-  const selectedExample = examples.find(ex => ex.id === selectedExampleId);
+  // Index examples by id so selection lookups don't scan the list on every render
+  const examplesById = useMemo(
+    () => new Map(examples.map(ex => [ex.id, ex])),
+    [examples]
+  );
+
+  const selectedExample = examplesById.get(selectedExampleId);
   const hasCorrectedDax = !!selectedExample?.correctedDaxFormula;
 
   // ADDED: Filter examples based on search query
@@ -59,7 +65,7 @@ const CurationApp = ({ modelType }) => {
 
   const handleExampleSelect = (exampleId) => {
     setSelectedExampleId(exampleId);
-    const example = examples.find(ex => ex.id === exampleId);
+    const example = examplesById.get(exampleId);
     if (example) {
       // Initialize chat with the example
       const initialMessages = [
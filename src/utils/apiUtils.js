@@ -1,6 +1,7 @@
 // src/utils/apiUtils.js
 
 import axios from 'axios';
+import { MODEL_ENDPOINTS } from './modelEndpoints';
 
 // Environment configuration
 const CONFIG = {
@@ -59,14 +60,6 @@ if (CONFIG.DEBUG) {
 }
 
 
-// Direct model endpoints (each model runs as separate FastAPI service)
-
-const MODEL_ENDPOINTS = {
-  cognos: process.env.REACT_APP_COGNOS_API_URL || '/api/cognos',
-  microstrategy: process.env.REACT_APP_MSTR_API_URL || '/api/mstr',
-  tableau: process.env.REACT_APP_TABLEAU_API_URL || '/api/tableau'
-};
-
 export const sendChatMessage = async (modelType, messages, exampleDetails = null) => {
   try {
     const requestBody = {
@@ -96,17 +89,9 @@ export const sendChatMessage = async (modelType, messages, exampleDetails = null
   }
 };
 
-// Mock function for development/testing when backend is not available
-export const mockChatResponse = (modelType, messages) => {
-  return new Promise((resolve) => {
-    setTimeout(() => {
-      const lastUserMessage = messages[messages.length - 1]?.content || '';
-      
-      // Generate a mock response based on the user's message
-      let mockResponse = '';
-      
-      if (lastUserMessage.toLowerCase().includes('var')) {
-        mockResponse = `Here's the DAX formula using VAR for better readability:
+// Canned mock replies, matched case-insensitively against the last message in order
+const MOCK_KEYWORD_RESPONSES = [
+  [/var/i, `Here's the DAX formula using VAR for better readability:
 
 \`\`\`dax
 VAR TotalRevenue = SUM([Revenue])
@@ -115,9 +100,8 @@ RETURN
     DIVIDE(TotalRevenue, TotalUnits)
 \`\`\`
 
-This approach stores intermediate calculations in variables, making the formula easier to read and maintain.`;
-      } else if (lastUserMessage.toLowerCase().includes('optimize')) {
-        mockResponse = `Here's an optimized version of the DAX formula:
+This approach stores intermediate calculations in variables, making the formula easier to read and maintain.`],
+  [/optimize/i, `Here's an optimized version of the DAX formula:
 
 \`\`\`dax
 CALCULATE(
@@ -126,9 +110,10 @@ CALCULATE(
 )
 \`\`\`
 
-This version uses CALCULATE with REMOVEFILTERS for better performance in certain scenarios.`;
-      } else {
-        mockResponse = `I understand you want to refine the DAX formula. Here's an improved version:
+This version uses CALCULATE with REMOVEFILTERS for better performance in certain scenarios.`]
+];
+
+const MOCK_DEFAULT_RESPONSE = `I understand you want to refine the DAX formula. Here's an improved version:
 
 \`\`\`dax
 SUMX(
@@ -138,7 +123,16 @@ SUMX(
 \`\`\`
 
 This uses SUMX for row-by-row calculation which can be more accurate for this type of division.`;
-      }
+
+// Mock function for development/testing when backend is not available
+export const mockChatResponse = (modelType, messages) => {
+  return new Promise((resolve) => {
+    setTimeout(() => {
+      const lastUserMessage = messages[messages.length - 1]?.content || '';
+      
+      // Generate a mock response based on the user's message
+      const matched = MOCK_KEYWORD_RESPONSES.find(([pattern]) => pattern.test(lastUserMessage));
+      const mockResponse = matched ? matched[1] : MOCK_DEFAULT_RESPONSE;
       
       resolve({
         reply: {
@@ -150,6 +144,27 @@ This uses SUMX for row-by-row calculation which can be more accurate for this ty
   });
 };
 
+// Known model API response formats, checked in order as [matches, extract]
+// pairs; the first matching format supplies the content even if it's empty
+const REPLY_FORMATS = [
+  // Our new chat API format
+  [data => data.reply && data.reply.content, data => data.reply.content],
+  // OpenAI-style response
+  [data => data.choices && data.choices[0], data => data.choices[0].message.content],
+  // Hugging Face style
+  [data => data.generated_text, data => data.generated_text],
+  // Custom response format
+  [data => data.response, data => data.response],
+  // Another common format
+  [data => data.output, data => data.output]
+];
+
+const extractReplyContent = (data) => {
+  const format = REPLY_FORMATS.find(([matches]) => matches(data));
+  // Fallback
+  return format ? format[1](data) : JSON.stringify(data);
+};
+
 // Alternative: Send directly to individual model APIs
 export const sendChatMessageDirect = async (modelType, messages, exampleDetails = null) => { // MODIFIED: Added exampleDetails
   try {
@@ -174,31 +189,10 @@ export const sendChatMessageDirect = async (modelType, messages, exampleDetails
     });
     
     // Adapt response format to match expected structure
-    let content = '';
-    if (response.data.reply && response.data.reply.content) {
-      // Our new chat API format
-      content = response.data.reply.content;
-    } else if (response.data.choices && response.data.choices[0]) {
-      // OpenAI-style response
-      content = response.data.choices[0].message.content;
-    } else if (response.data.generated_text) {
-      // Hugging Face style
-      content = response.data.generated_text;
-    } else if (response.data.response) {
-      // Custom response format
-      content = response.data.response;
-    } else if (response.data.output) {
-      // Another common format
-      content = response.data.output;
-    } else {
-      // Fallback
-      content = JSON.stringify(response.data);
-    }
-    
     return {
       reply: {
         role: 'assistant',
-        content: content
+        content: extractReplyContent(response.data)
       }
     };
     
@@ -233,17 +227,8 @@ export const sendChatMessageWithFallback = async (modelType, messages, exampleDe
 // New function for structured DAX correction
 export const correctDaxFormula = async (modelType, sourceExpression, targetDaxFormula) => {
   try {
-    // Determine API URL based on model type
-    let apiUrl;
-    if (modelType === 'microstrategy') {
-      apiUrl = `${MODEL_ENDPOINTS.microstrategy}/api/dax/correct`;
-    } else if (modelType === 'cognos') {
-      apiUrl = `${MODEL_ENDPOINTS.cognos}/api/dax/correct`;
-    } else if (modelType === 'tableau') {
-      apiUrl = `${MODEL_ENDPOINTS.tableau}/api/dax/correct`;
-    } else {
-      apiUrl = `${CONFIG.API_BASE_URL}/api/dax/correct`;
-    }
+    // Use the model's own service, falling back to the base API for unknown model types
+    const apiUrl = `${MODEL_ENDPOINTS[modelType] || CONFIG.API_BASE_URL}/api/dax/correct`;
 
     const response = await axios.post(apiUrl, {
       model_type: modelType,
@@ -1,12 +1,10 @@
 // Data loading utilities
 
+import { MODEL_ENDPOINTS } from './modelEndpoints';
+
 // Environment configuration
 const CONFIG = {
   API_BASE_URL: process.env.REACT_APP_API_BASE_URL || '/api/mstr',
-
-  MSTR_API_URL: process.env.REACT_APP_MSTR_API_URL || '/api/mstr',
-  COGNOS_API_URL: process.env.REACT_APP_COGNOS_API_URL || '/api/cognos',
-  TABLEAU_API_URL: process.env.REACT_APP_TABLEAU_API_URL || '/api/tableau',
   API_TIMEOUT: parseInt(process.env.REACT_APP_API_TIMEOUT) || 30000,
   DEBUG: process.env.REACT_APP_DEBUG === 'true'
 };
@@ -50,22 +48,18 @@ const apiCall = async (url, options = {}) => {
   }
 };
 
-export const loadExamples = async (modelType) => {
-  try {
-    // Determine API URL based on model type (each model has its own service)
-    let apiUrl;
-    if (modelType === 'microstrategy') {
-      apiUrl = `${CONFIG.MSTR_API_URL}/api/examples/${modelType}`;
-    } else if (modelType === 'cognos') {
-      apiUrl = `${CONFIG.COGNOS_API_URL}/api/examples/${modelType}`;
-    } else if (modelType === 'tableau') {
-      apiUrl = `${CONFIG.TABLEAU_API_URL}/api/examples/${modelType}`;
-    } else {
-      // Fallback for unknown model types
-      apiUrl = `${CONFIG.API_BASE_URL}/api/v1/examples/${modelType}`;
-    }
+// Build an examples API URL on the model's own service, falling back to the
+// base API for unknown model types
+const examplesApiUrl = (modelType, route) => {
+  const modelUrl = MODEL_ENDPOINTS[modelType];
+  return modelUrl
+    ? `${modelUrl}/api/examples/${route}`
+    : `${CONFIG.API_BASE_URL}/api/v1/examples/${route}`;
+};
 
-    const apiResponse = await apiCall(apiUrl);
+const fetchExamples = async (modelType) => {
+  try {
+    const apiResponse = await apiCall(examplesApiUrl(modelType, modelType));
     if (apiResponse.ok) {
       const data = await apiResponse.json();
       return data.examples.map(example => ({
@@ -99,22 +93,27 @@ export const loadExamples = async (modelType) => {
   }
 };
 
+// In-flight loads keyed by model type, so concurrent callers (e.g. effects
+// double-invoked under StrictMode) share a single request. Writes drop the
+// entry so the next load can't reuse a request started before the write.
+const pendingLoads = {};
+
+export const loadExamples = (modelType) => {
+  if (!pendingLoads[modelType]) {
+    const load = fetchExamples(modelType).finally(() => {
+      if (pendingLoads[modelType] === load) {
+        delete pendingLoads[modelType];
+      }
+    });
+    pendingLoads[modelType] = load;
+  }
+  return pendingLoads[modelType];
+};
+
 // Add new example via API
 export const addExampleToFile = async (modelType, example) => {
   try {
-    // Determine API URL based on model type
-    let apiUrl;
-    if (modelType === 'microstrategy') {
-      apiUrl = `${CONFIG.MSTR_API_URL}/api/examples/add`;
-    } else if (modelType === 'cognos') {
-      apiUrl = `${CONFIG.COGNOS_API_URL}/api/examples/add`;
-    } else if (modelType === 'tableau') {
-      apiUrl = `${CONFIG.TABLEAU_API_URL}/api/examples/add`;
-    } else {
-      apiUrl = `${CONFIG.API_BASE_URL}/api/v1/examples/add`;
-    }
-      
-    const response = await apiCall(apiUrl, {
+    const response = await apiCall(examplesApiUrl(modelType, 'add'), {
       method: 'POST',
       body: JSON.stringify({
         modelType,
@@ -127,6 +126,7 @@ export const addExampleToFile = async (modelType, example) => {
     });
 
     if (response.ok) {
+      delete pendingLoads[modelType];
       const result = await response.json();
       return { success: true, message: result.message };
     } else {
@@ -142,19 +142,7 @@ export const addExampleToFile = async (modelType, example) => {
 // Update corrected DAX formula via API
 export const updateCorrectedDax = async (modelType, exampleId, correctedDaxFormula, previousDaxFormula, confidenceScore = null) => {
   try {
-    // Determine API URL based on model type
-    let apiUrl;
-    if (modelType === 'microstrategy') {
-      apiUrl = `${CONFIG.MSTR_API_URL}/api/examples/update-correction`;
-    } else if (modelType === 'cognos') {
-      apiUrl = `${CONFIG.COGNOS_API_URL}/api/examples/update-correction`;
-    } else if (modelType === 'tableau') {
-      apiUrl = `${CONFIG.TABLEAU_API_URL}/api/examples/update-correction`;
-    } else {
-      apiUrl = `${CONFIG.API_BASE_URL}/api/v1/examples/update-correction`;
-    }
-      
-    const response = await apiCall(apiUrl, {
+    const response = await apiCall(examplesApiUrl(modelType, 'update-correction'), {
       method: 'POST',
       body: JSON.stringify({
         modelType,
@@ -166,6 +154,7 @@ export const updateCorrectedDax = async (modelType, exampleId, correctedDaxFormu
     });
 
     if (response.ok) {
+      delete pendingLoads[modelType];
       const result = await response.json();
       return { success: true, message: result.message };
     } else {
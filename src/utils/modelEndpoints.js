@@ -0,0 +1,7 @@
+// Direct model endpoints (each model runs as separate FastAPI service)
+
+export const MODEL_ENDPOINTS = {
+  cognos: process.env.REACT_APP_COGNOS_API_URL || '/api/cognos',
+  microstrategy: process.env.REACT_APP_MSTR_API_URL || '/api/mstr',
+  tableau: process.env.REACT_APP_TABLEAU_API_URL || '/api/tableau'
+};